@@ -13,27 +13,93 @@
 #   limitations under the License.
 
 
+from typing import Optional
+
 import numpy as np
 import numpy.typing as npt
 
 from sklearn.metrics import pairwise_distances as PD
 
 
+def estimate_slice_bytes(n_mask_pixels: int, n_particles: int) -> int:
+    """Estimate the peak memory needed for the membrane pixel-particle distance matrix of one slice.
+    pairwise_distances holds up to two float64 matrices of this shape while computing.
+
+    Args:
+    n_mask_pixels (int) : Number of membrane pixels in the slice
+    n_particles (int)   : Number of particles in the slice
+
+    Returns:
+    int
+    """
+    return 2 * n_mask_pixels * n_particles * np.dtype(np.float64).itemsize
+
+
+def get_tile_rows(n_particles: int, max_memory_bytes: int) -> int:
+    """Calculate the number of membrane pixels per tile so that a tile of the distance matrix fits in the given memory.
+
+    Args:
+    n_particles (int)      : Number of particles in the slice
+    max_memory_bytes (int) : Memory available for the distance matrix in bytes
+
+    Returns:
+    int
+    """
+    return max(1, max_memory_bytes // estimate_slice_bytes(1, max(n_particles, 1)))
+
+
+def get_closest_mask_args(
+    seg_mask: npt.NDArray[any],
+    coords_2d: npt.NDArray[any],
+    *,
+    tile_rows: Optional[int] = None,
+) -> npt.NDArray[any]:
+    """Find the index of the closest membrane pixel for each particle.
+    If tile_rows is given, the distance matrix is computed in tiles of membrane pixels and never held in full.
+
+    Args:
+    seg_mask (ndarray)        : Coordinates of the membrane pixels
+    coords_2d (ndarray)       : Coordinates of the particles
+    tile_rows (Optional, int) : Number of membrane pixels per tile. Default = None (no tiling)
+
+    Returns:
+    ndarray
+    """
+    if tile_rows is None or tile_rows >= len(seg_mask):
+        return np.argmin(PD(seg_mask, coords_2d), axis=0)
+
+    # Keep the first closest pixel on ties, as np.argmin does on the full matrix
+    particle_idx = np.arange(len(coords_2d))
+    best_dist = np.full(len(coords_2d), np.inf)
+    best_args = np.zeros(len(coords_2d), dtype=int)
+    for start in range(0, len(seg_mask), tile_rows):
+        dmat = PD(seg_mask[start : start + tile_rows], coords_2d)
+        tile_args = np.argmin(dmat, axis=0)
+        tile_dist = dmat[tile_args, particle_idx]
+        closer = tile_dist < best_dist
+        best_dist[closer] = tile_dist[closer]
+        best_args[closer] = tile_args[closer] + start
+
+    return best_args
+
+
 def get_distribution(
     seg_map: npt.NDArray[any],
     coords: npt.NDArray[any],
     pixel_size_nm: float,
     *,
     slice_idx: list = [],
+    max_memory_bytes: Optional[int] = None,
 ) -> list:
     """Evaluates the distribution of particles for given slices.
     If slice indices are not given, evaluate the entire stack.
 
     Args:
-    seg_map (ndarray)          : 3D map containing one segmented membrane
-    coords (ndarray)           : Coordinates of the picked particles in the ZXY order
-    pixel_size_nm (float)      : Pixel size of seg_map in nanometers
-    slice_idx (Optional, list) : List of Z-slice indices to be evaluated
+    seg_map (ndarray)                : 3D map containing one segmented membrane
+    coords (ndarray)                 : Coordinates of the picked particles in the ZXY order
+    pixel_size_nm (float)            : Pixel size of seg_map in nanometers
+    slice_idx (Optional, list)       : List of Z-slice indices to be evaluated
+    max_memory_bytes (Optional, int) : Memory available for the distance matrix of a slice. Larger slices are computed in tiles. Default = None (no limit)
 
     Returns:
     list
@@ -48,13 +114,21 @@ def get_distribution(
             trimmed_coords_slice = np.asarray([i for i in coords if i[0] == slice_no])
             coords_slice_2d = trimmed_coords_slice[:, [2, 1]]
 
+            tile_rows = None
+            if (
+                max_memory_bytes is not None
+                and estimate_slice_bytes(len(seg_mask), len(coords_slice_2d))
+                > max_memory_bytes
+            ):
+                tile_rows = get_tile_rows(len(coords_slice_2d), max_memory_bytes)
+
             try:
-                dmat = PD(seg_mask, coords_slice_2d)
+                closest_args = get_closest_mask_args(
+                    seg_mask, coords_slice_2d, tile_rows=tile_rows
+                )
             except:
                 continue
             else:
-                min_dist = dmat.min(axis=0)
-                closest_args = np.argmin(dmat, axis=0)
                 distribution = (
                     coords_slice_2d - seg_mask[closest_args]
                 ) * pixel_size_nm
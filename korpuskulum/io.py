@@ -12,15 +12,19 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
+from collections import OrderedDict
 from itertools import product
 from pathlib import Path
 from glob import glob
+import re
+import typing
 
 import numpy as np
 import numpy.typing as npt
 import pandas as pd
 
 import tifffile
+import starfile
 
 from icecream import ic
 
@@ -68,6 +72,18 @@ def load_membrane(file_in: str) -> npt.NDArray[any]:
     return segm
 
 
+def get_membrane_nbytes(file_in: str) -> int:
+    """Get the size in memory of a membrane segmentation map from its TIFF header, without loading it."""
+    try:
+        with tifffile.TiffFile(file_in) as tif:
+            series = tif.series[0]
+            nbytes = int(np.prod(series.shape)) * series.dtype.itemsize
+    except:
+        raise IOError(f"Error reading in {file_in}. Check file availability or type?")
+
+    return nbytes
+
+
 def load_coords(file_in: str, *, order: str = "zxy") -> npt.NDArray[any]:
     data = np.loadtxt(file_in).astype(int)
 
@@ -79,9 +95,223 @@ def load_coords(file_in: str, *, order: str = "zxy") -> npt.NDArray[any]:
     return data, restoration_order
 
 
-def export_conversion_table(membrane_list: list, coords_list: list) -> pd.DataFrame:
-    permutations_gen = product(range(len(membrane_list)), range(len(coords_list)))
-    permutations_array = np.array(list(permutations_gen)).T
+def get_file_signature(file_in: str) -> tuple:
+    """Get the modification time (ns) and size of a file, used to detect new or changed inputs."""
+    stat = Path(file_in).stat()
+
+    return stat.st_mtime_ns, stat.st_size
+
+
+class FileCache:
+    """Bounded least-recently-used cache of data loaded from files.
+    Entries are reloaded when the file signature (modification time and size) changes.
+
+    Args:
+    loader (callable)         : Function loading (and optionally preprocessing) a file, given its path
+    maxsize (Optional, int)   : Maximum number of files held in memory. Default = 8
+    max_bytes (Optional, int) : Maximum total size of the arrays held in memory. The most recently used file is always kept. Default = None (no limit)
+    """
+
+    def __init__(
+        self,
+        loader: typing.Callable,
+        maxsize: int = 8,
+        max_bytes: typing.Optional[int] = None,
+    ):
+        assert (
+            maxsize > 0
+        ), "Error in korpus.io:FileCache: Cache size must be a positive integer."
+        self.loader = loader
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _get_nbytes(value) -> int:
+        if isinstance(value, (tuple, list)):
+            return sum(FileCache._get_nbytes(i) for i in value)
+
+        return getattr(value, "nbytes", 0)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(self._get_nbytes(value) for _, value in self._entries.values())
+
+    def get(self, file_in: str):
+        key = str(file_in)
+        signature = get_file_signature(file_in)
+
+        if key in self._entries and self._entries[key][0] == signature:
+            self._entries.move_to_end(key)
+            return self._entries[key][1]
+
+        value = self.loader(file_in)
+        self._entries[key] = (signature, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize or (
+            self.max_bytes is not None
+            and len(self._entries) > 1
+            and self.nbytes > self.max_bytes
+        ):
+            self._entries.popitem(last=False)
+
+        return value
+
+
+def get_file_label(
+    file_in: str,
+    pattern: typing.Optional[str] = None,
+    *,
+    default: typing.Optional[str] = None,
+) -> str:
+    """Extract a label (e.g. particle species or membrane class) from a file name using a regular expression.
+    The first capture group is used if the pattern has one, otherwise the whole match.
+
+    Args:
+    file_in (str)           : Path to file being labelled
+    pattern (Optional, str) : Regular expression searched for in the file stem
+    default (Optional, str) : Label returned if no pattern is given or the pattern doesn't match
+
+    Returns:
+    str
+    """
+    if pattern is None:
+        return default
+
+    match = re.search(pattern, Path(file_in).stem)
+    if match is None:
+        return default
+
+    return match.group(1) if match.groups() else match.group(0)
+
+
+def _find_manifest_entry(
+    entry: str, manifest_dir: Path, file_list: list, resolved_list: list
+) -> typing.Optional[int]:
+    """Find the index of a manifest entry in a list of files.
+    Relative entries are resolved against the manifest folder. If no file matches the full path, the entry is matched by file name, which must then be unique.
+
+    Args:
+    entry (str)          : File path given in the manifest
+    manifest_dir (Path)  : Folder containing the manifest
+    file_list (list)     : List of input files
+    resolved_list (list) : Resolved paths of the input files
+
+    Returns:
+    int or None
+    """
+    entry_path = Path(entry)
+    if not entry_path.is_absolute():
+        entry_path = manifest_dir / entry_path
+
+    if entry_path.resolve() in resolved_list:
+        return resolved_list.index(entry_path.resolve())
+
+    name_matches = [
+        idx for idx, f in enumerate(file_list) if Path(f).name == entry_path.name
+    ]
+    assert (
+        len(name_matches) <= 1
+    ), f"Error in korpus.io:pair_inputs: Manifest entry {entry} matches several inputs by file name ({', '.join(str(file_list[i]) for i in name_matches)}). Use full paths or paths relative to the manifest."
+
+    return name_matches[0] if len(name_matches) == 1 else None
+
+
+def pair_inputs(
+    membrane_list: list,
+    coords_list: list,
+    *,
+    mode: str = "all",
+    manifest: typing.Optional[str] = None,
+    pattern: typing.Optional[str] = None,
+    ignore_missing: bool = False,
+) -> list:
+    """Determine which membrane-coordinates pairs are to be evaluated.
+
+    Args:
+    membrane_list (list)     : List of membrane segmentation files
+    coords_list (list)       : List of particle coordinates files
+    mode (str)               : Pairing mode. all: every membrane with every coordinates file; stem: files with identical stems; manifest: pairs listed in a STAR/CSV manifest; regex: files whose stems give the same label with the given pattern
+    manifest (Optional, str) : STAR or CSV file with membrane_file and particle_file columns, relative to the manifest folder (mode = manifest)
+    pattern (Optional, str)  : Regular expression extracting the matching key from file stems (mode = regex)
+    ignore_missing (bool)    : Skip manifest entries not found in the given inputs instead of raising an error
+
+    Returns:
+    list
+    """
+    assert mode in [
+        "all",
+        "stem",
+        "manifest",
+        "regex",
+    ], f"Error in korpus.io:pair_inputs: Unknown pairing mode {mode}."
+
+    if mode == "all":
+        return list(product(range(len(membrane_list)), range(len(coords_list))))
+
+    if mode == "manifest":
+        assert (
+            manifest is not None
+        ), "Error in korpus.io:pair_inputs: A manifest file must be given for manifest pairing."
+        if Path(manifest).suffix == ".star":
+            manifest_df = starfile.read(manifest)
+        else:
+            manifest_df = pd.read_csv(manifest)
+
+        manifest_dir = Path(manifest).resolve().parent
+        membrane_resolved = [Path(f).resolve() for f in membrane_list]
+        coords_resolved = [Path(f).resolve() for f in coords_list]
+        pairs = []
+        for m, c in zip(manifest_df["membrane_file"], manifest_df["particle_file"]):
+            m_idx = _find_manifest_entry(
+                m, manifest_dir, membrane_list, membrane_resolved
+            )
+            c_idx = _find_manifest_entry(c, manifest_dir, coords_list, coords_resolved)
+            if ignore_missing and (m_idx is None or c_idx is None):
+                continue
+            assert (
+                m_idx is not None and c_idx is not None
+            ), f"Error in korpus.io:pair_inputs: Manifest entry ({m}, {c}) not found in given inputs."
+            pairs.append((m_idx, c_idx))
+
+        return sorted(set(pairs))
+
+    if mode == "stem":
+        membrane_keys = [Path(m).stem for m in membrane_list]
+        coords_keys = [Path(c).stem for c in coords_list]
+    else:
+        assert (
+            pattern is not None
+        ), "Error in korpus.io:pair_inputs: A pattern must be given for regex pairing."
+        membrane_keys = [get_file_label(m, pattern) for m in membrane_list]
+        coords_keys = [get_file_label(c, pattern) for c in coords_list]
+
+    coords_by_key = {}
+    for c_idx, key in enumerate(coords_keys):
+        coords_by_key.setdefault(key, []).append(c_idx)
+
+    pairs = [
+        (m_idx, c_idx)
+        for m_idx, key in enumerate(membrane_keys)
+        if key is not None
+        for c_idx in coords_by_key.get(key, [])
+    ]
+
+    return pairs
+
+
+def export_conversion_table(
+    membrane_list: list,
+    coords_list: list,
+    *,
+    pairs: typing.Optional[list] = None,
+) -> pd.DataFrame:
+    if pairs is None:
+        pairs = list(product(range(len(membrane_list)), range(len(coords_list))))
+    permutations_array = np.array(pairs, dtype=int).reshape(-1, 2).T
 
     membrane_idx = permutations_array[0]
     coords_idx = permutations_array[1]
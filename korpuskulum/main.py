@@ -21,6 +21,7 @@ from typing_extensions import Annotated
 from datetime import datetime as dt
 import logging
 import re
+import time
 
 import typer
 import numpy as np
@@ -51,6 +52,181 @@ def _unique_rows(array_in):
     return out
 
 
+def _new_accumulators(dist_range: list, n_bins: int) -> dict:
+    """Create an empty pair of fixed-bin histogram accumulators for aggregate plots."""
+    return dict(
+        polar=plotting.PolarHistAccumulator(
+            dist_cutoff=max(dist_range), n_dist_bins=n_bins
+        ),
+        mindist=plotting.MinDistHistAccumulator(
+            dist_low=min(dist_range), dist_high=max(dist_range), n_bins=n_bins
+        ),
+    )
+
+
+def _save_accumulators(accumulators: dict, folder: str):
+    """Save histogram accumulators and their plots as <folder>/<species>/<membrane class>_{polar,mindist}.*
+
+    Args:
+    accumulators (dict) : Dictionary mapping (species, membrane class) to dictionaries of accumulators
+    folder (str)        : Path to aggregate output folder
+    """
+    for (species, membrane_class), acc in accumulators.items():
+        Path(f"{folder}/{species}/").mkdir(parents=True, exist_ok=True)
+        file_prefix = f"{folder}/{species}/{membrane_class}"
+
+        if "polar" in acc:
+            acc["polar"].save(f"{file_prefix}_polar.npz")
+            acc["polar"].plot(savefig=f"{file_prefix}_polar_distro.png")
+        if "mindist" in acc:
+            acc["mindist"].save(f"{file_prefix}_mindist.npz")
+            acc["mindist"].plot(
+                protein_name=species,
+                membrane_name=membrane_class,
+                savefig=f"{file_prefix}_mindist_distro.png",
+            )
+
+
+def _prepare_membrane(file_in: str) -> tuple:
+    """Load a membrane segmentation map and find the Z-slices containing membrane pixels."""
+    seg_map = io.load_membrane(file_in)
+    seg_nonempty = np.argwhere(np.sum(seg_map, axis=(1, 2)) != 0).flatten()
+
+    return seg_map, seg_nonempty
+
+
+def _get_distance_budget(
+    max_memory_bytes: typing.Optional[int], resident_bytes: int
+) -> typing.Optional[int]:
+    """Get the memory left for distance computations once the given data is held in memory.
+
+    Args:
+    max_memory_bytes (Optional, int) : Memory budget of the run in bytes, or None if unconstrained
+    resident_bytes (int)             : Memory taken up by loaded membranes and coordinates in bytes
+
+    Returns:
+    int or None
+    """
+    if max_memory_bytes is None:
+        return None
+
+    budget = max_memory_bytes - resident_bytes
+    if budget <= 0:
+        raise MemoryError(
+            f"Loaded data ({resident_bytes / 1024**3:.2f} GB) exceeds the memory budget given by --max-memory ({max_memory_bytes / 1024**3:.2f} GB)."
+        )
+
+    return budget
+
+
+def _get_file_prefix(m_idx: int, c_idx: int) -> str:
+    """Get the prefix of the output files of a membrane-coordinates pair."""
+    return f"ptcl_{c_idx:02}_memb_{m_idx:02}"
+
+
+def _evaluate_pair(
+    seg_map: np.ndarray,
+    seg_nonempty: np.ndarray,
+    coords: np.ndarray,
+    restoration_order: list,
+    m_idx: int,
+    c_idx: int,
+    params,
+    output_folder: str,
+    *,
+    max_memory_bytes: typing.Optional[int] = None,
+) -> tuple:
+    """Evaluate one membrane-coordinates pair, saving its plots and side-split coordinates to the output folder.
+
+    Args:
+    seg_map (ndarray)                : 3D map containing one segmented membrane
+    seg_nonempty (ndarray)           : Indices of the Z-slices of seg_map containing membrane pixels
+    coords (ndarray)                 : Coordinates of the picked particles in the ZXY order
+    restoration_order (list)         : Order restoring the coordinates to the input system
+    m_idx (int)                      : Index of the membrane file
+    c_idx (int)                      : Index of the coordinates file
+    params (Config)                  : Objectified user inputs
+    output_folder (str)              : Path to output folder
+    max_memory_bytes (Optional, int) : Memory available for the distance computations. Default = None (no limit)
+
+    Returns:
+    tuple (minimum distances, angles, orientations)
+    """
+    # Calculate distributions
+    eval_slice_idx = np.intersect1d(seg_nonempty, np.unique(coords.T[0]).astype(int))
+    stack_distro_list = evaluate.get_distribution(
+        seg_map=seg_map,
+        coords=coords,
+        pixel_size_nm=params.pixel_size_nm,
+        slice_idx=eval_slice_idx,
+        max_memory_bytes=max_memory_bytes,
+    )
+    stack_distro = np.vstack([i[0] for i in stack_distro_list])
+    slice_numbers = np.concatenate([i[1] for i in stack_distro_list])
+    orientations = np.concatenate([i[2] for i in stack_distro_list])
+    trimmed_coords = np.vstack([i[3] for i in stack_distro_list])
+
+    # Get minimum distance and angular arguments in radians
+    min_dist = np.linalg.norm(stack_distro, axis=1)
+    angles = np.arctan2(*stack_distro.T[::-1])
+
+    # Plot polar distribution and minimum distance distribution
+    if not Path(output_folder).is_dir():
+        Path(output_folder).mkdir()
+    if not Path(f"{output_folder}/coords/").is_dir():
+        Path(f"{output_folder}/coords/").mkdir()
+    file_prefix = _get_file_prefix(m_idx, c_idx)
+
+    plotting.plot_polar_hist(
+        dist_array=min_dist,
+        angle_array=angles,
+        savefig=f"{output_folder}/{file_prefix}_polar_distro.png",
+    )
+    plotting.plot_min_dist_hist(
+        dist_array=min_dist,
+        orientations=orientations,
+        protein_name=f"ptcl_{c_idx}",
+        membrane_name=f"memb_{m_idx}",
+        dist_low=min(params.dist_range),
+        dist_high=max(params.dist_range),
+        savefig=f"{output_folder}/{file_prefix}_mindist_distro.png",
+    )
+
+    # Pick coordinates for configuration and save to files
+    side_1 = trimmed_coords[
+        (
+            (orientations == 1)
+            & np.logical_and(
+                min(params.dist_range) <= min_dist,
+                min_dist <= max(params.dist_range),
+            )
+        )
+    ]
+
+    side_0 = trimmed_coords[
+        (
+            (orientations != 1)
+            & np.logical_and(
+                min(params.dist_range) <= min_dist,
+                min_dist <= max(params.dist_range),
+            )
+        )
+    ]
+
+    np.savetxt(
+        f"{output_folder}/coords/{file_prefix}_side_1.txt",
+        side_1[:, restoration_order],
+        fmt="%4d",
+    )
+    np.savetxt(
+        f"{output_folder}/coords/{file_prefix}_side_0.txt",
+        side_0[:, restoration_order],
+        fmt="%4d",
+    )
+
+    return min_dist, angles, orientations
+
+
 app = typer.Typer(callback=callback)
 
 
@@ -114,6 +290,63 @@ def main(
             help="Path to output folder. If specified folder does not exist, Korpuskulum will create it first. Default: ./results/",
         ),
     ] = "./results/",
+    pairing: Annotated[
+        str,
+        typer.Option(
+            "-p",
+            "--pairing",
+            help="Pairing of membranes and particle coordinates. all: evaluate every membrane against every coordinates file; stem: only pair files with identical file stems (e.g. TS_01.tif and TS_01.txt); manifest: only pair files listed in the --manifest file; regex: only pair files for which --pair_pattern extracts the same key. Default: all",
+        ),
+    ] = "all",
+    manifest: Annotated[
+        typing.Optional[str],
+        typer.Option(
+            "--manifest",
+            help="STAR or CSV file with membrane_file and particle_file columns listing the pairs to be evaluated (--pairing manifest). Entries are matched to the inputs by path (relative paths are taken from the manifest folder) or, if unambiguous, by file name. A conversion_lookup.star file from a previous run can be used.",
+        ),
+    ] = None,
+    pair_pattern: Annotated[
+        typing.Optional[str],
+        typer.Option(
+            "--pair_pattern",
+            help="Regular expression applied to both membrane and coordinates file stems (--pairing regex). Files are paired if the first capture group (or the whole match) is identical, e.g. 'TS_\\d+'.",
+        ),
+    ] = None,
+    max_memory: Annotated[
+        typing.Optional[float],
+        typer.Option(
+            "--max-memory",
+            help="Memory budget of the run in gigabytes. Membrane sizes are checked against the budget before any evaluation, and distance computations which wouldn't fit in the memory left after loading a membrane and its particles are split into tiles. Results are identical to an unconstrained run. (Optional)",
+        ),
+    ] = None,
+    aggregate: Annotated[
+        bool,
+        typer.Option(
+            "--aggregate",
+            help="Accumulate fixed-bin polar and minimum distance histograms over all evaluated pairs and save dataset-level plots (and mergeable histogram files) to <output>/aggregate/. The polar histograms are cut off at the upper bound of --range.",
+        ),
+    ] = False,
+    agg_bins: Annotated[
+        int,
+        typer.Option(
+            "--agg_bins",
+            help="Number of distance bins used in the aggregate histograms. The polar histograms use 36 angular bins.",
+        ),
+    ] = 20,
+    species_pattern: Annotated[
+        typing.Optional[str],
+        typer.Option(
+            "--species_pattern",
+            help="Regular expression applied to the particle coordinates file names to group them into species for the aggregate plots. The first capture group (or the whole match) is used as the species label. Labels name the folders merged by `korpus aggregate`, so they should be the same in every run. Histograms over all species are always saved under the label 'all'. (Optional; default: the coordinates file stem)",
+        ),
+    ] = None,
+    class_pattern: Annotated[
+        typing.Optional[str],
+        typer.Option(
+            "--class_pattern",
+            help="Regular expression applied to the membrane file names to group them into membrane classes for the aggregate plots. The first capture group (or the whole match) is used as the class label. Histograms over all membranes are always saved under the label 'all'. (Optional)",
+        ),
+    ] = None,
 ):
     """Main API for Korpuskulum"""
 
@@ -141,91 +374,476 @@ def main(
         order=coords_order,
     )
 
+    # Determine membrane-coordinates pairs to be evaluated
+    pairs = io.pair_inputs(
+        membrane_list,
+        coords_list,
+        mode=pairing,
+        manifest=manifest,
+        pattern=pair_pattern,
+    )
+    assert (
+        len(pairs) > 0
+    ), f"No membrane-coordinates pairs found with --pairing {pairing}. Check the file names, --manifest or --pair_pattern."
+    coords_by_membrane = {}
+    for m_idx, c_idx in pairs:
+        coords_by_membrane.setdefault(m_idx, []).append(c_idx)
+
+    # Check membrane sizes against the memory budget before evaluating anything
+    max_memory_bytes = None if max_memory is None else int(max_memory * 1024**3)
+    if max_memory_bytes is not None:
+        for m_idx in coords_by_membrane:
+            _get_distance_budget(
+                max_memory_bytes, io.get_membrane_nbytes(membrane_list[m_idx])
+            )
+
     # Evaluation loops
+    accumulators = {}
     with prog_bar.prog_bar as p:
         prog_bar.clear_tasks(p)
-        for m_idx, m in p.track(enumerate(membrane_list), total=len(membrane_list)):
-            seg_map = io.load_membrane(m)
-            seg_nonempty = np.argwhere(np.sum(seg_map, axis=(1, 2)) != 0).flatten()
+        for m_idx in p.track(sorted(coords_by_membrane), total=len(coords_by_membrane)):
+            m = membrane_list[m_idx]
+            seg_map, seg_nonempty = _prepare_membrane(m)
 
-            for c_idx, c in enumerate(coords_list):
+            for c_idx in coords_by_membrane[m_idx]:
+                c = coords_list[c_idx]
                 coords, restoration_order = io.load_coords(c, order=params.order)
-
-                # Calculate distributions
-                eval_slice_idx = np.intersect1d(
-                    seg_nonempty, np.unique(coords.T[0]).astype(int)
+                distance_budget = _get_distance_budget(
+                    max_memory_bytes,
+                    seg_map.nbytes + seg_nonempty.nbytes + coords.nbytes,
                 )
-                stack_distro_list = evaluate.get_distribution(
-                    seg_map=seg_map,
-                    coords=coords,
-                    pixel_size_nm=pixel_size_nm,
-                    slice_idx=eval_slice_idx,
-                )
-                stack_distro = np.vstack([i[0] for i in stack_distro_list])
-                slice_numbers = np.concatenate([i[1] for i in stack_distro_list])
-                orientations = np.concatenate([i[2] for i in stack_distro_list])
-                trimmed_coords = np.vstack([i[3] for i in stack_distro_list])
-
-                # Get minimum distance and angular arguments in radians
-                min_dist = np.linalg.norm(stack_distro, axis=1)
-                angles = np.arctan2(*stack_distro.T[::-1])
-
-                # Plot polar distribution and minimum distance distribution
-                if not Path(output_folder).is_dir():
-                    Path(output_folder).mkdir()
-                if not Path(f"{output_folder}/coords/").is_dir():
-                    Path(f"{output_folder}/coords/").mkdir()
-                file_prefix = f"ptcl_{c_idx:02}_memb_{m_idx:02}"
-
-                plotting.plot_polar_hist(
-                    dist_array=min_dist,
-                    angle_array=angles,
-                    savefig=f"{output_folder}/{file_prefix}_polar_distro.png",
-                )
-                plotting.plot_min_dist_hist(
-                    dist_array=min_dist,
-                    orientations=orientations,
-                    protein_name=f"ptcl_{c_idx}",
-                    membrane_name=f"memb_{m_idx}",
-                    dist_low=min(params.dist_range),
-                    dist_high=max(params.dist_range),
-                    savefig=f"{output_folder}/{file_prefix}_mindist_distro.png",
+
+                min_dist, angles, orientations = _evaluate_pair(
+                    seg_map,
+                    seg_nonempty,
+                    coords,
+                    restoration_order,
+                    m_idx,
+                    c_idx,
+                    params,
+                    output_folder,
+                    max_memory_bytes=distance_budget,
                 )
 
-                # Pick coordinates for configuration and save to files
-                side_1 = trimmed_coords[
-                    (
-                        (orientations == 1)
-                        & np.logical_and(
-                            min(params.dist_range) <= min_dist,
-                            min_dist <= max(params.dist_range),
-                        )
-                    )
-                ]
-
-                side_0 = trimmed_coords[
-                    (
-                        (orientations != 1)
-                        & np.logical_and(
-                            min(params.dist_range) <= min_dist,
-                            min_dist <= max(params.dist_range),
-                        )
+                # Update dataset-level histograms
+                if aggregate:
+                    species = io.get_file_label(
+                        c, species_pattern, default=Path(c).stem
                     )
-                ]
-
-                np.savetxt(
-                    f"{output_folder}/coords/{file_prefix}_side_1.txt",
-                    side_1[:, restoration_order],
-                    fmt="%4d",
-                )
-                np.savetxt(
-                    f"{output_folder}/coords/{file_prefix}_side_0.txt",
-                    side_0[:, restoration_order],
-                    fmt="%4d",
-                )
+                    membrane_class = io.get_file_label(m, class_pattern, default="all")
+                    # Dataset-wide buckets are filled whatever the species labels are
+                    for key in {
+                        (species, "all"),
+                        (species, membrane_class),
+                        ("all", "all"),
+                        ("all", membrane_class),
+                    }:
+                        if key not in accumulators:
+                            accumulators[key] = _new_accumulators(
+                                dist_range=params.dist_range, n_bins=agg_bins
+                            )
+                        accumulators[key]["polar"].update(min_dist, angles)
+                        accumulators[key]["mindist"].update(min_dist, orientations)
+
+    # Save dataset-level histograms
+    if aggregate:
+        _save_accumulators(accumulators, f"{output_folder}/aggregate/")
 
     # Export index-file conversion table
     conversion_df = io.export_conversion_table(
-        membrane_list=membrane_list, coords_list=coords_list
+        membrane_list=membrane_list, coords_list=coords_list, pairs=pairs
     )
     starfile.write(conversion_df, "./conversion_lookup.star")
+
+
+@app.command()
+def aggregate(
+    input_folders: Annotated[
+        list[str],
+        typer.Option(
+            "-i",
+            "--input",
+            help="Aggregate folder(s) produced by `korpus main --aggregate`, e.g. from different shards or processes. Can be given multiple times.",
+        ),
+    ],
+    output_folder: Annotated[
+        typing.Optional[str],
+        typer.Option(
+            "-out",
+            "--output",
+            help="Path to output folder for the merged histograms and plots. Default: ./results/aggregate/",
+        ),
+    ] = "./results/aggregate/",
+):
+    """Merge aggregate histograms from several Korpuskulum runs"""
+
+    accumulators = {}
+    for folder in input_folders:
+        for kind in ["polar", "mindist"]:
+            for f in sorted(Path(folder).glob(f"*/*_{kind}.npz")):
+                key = (f.parent.name, f.name.removesuffix(f"_{kind}.npz"))
+                acc = plotting.load_accumulator(f)
+                accumulators.setdefault(key, {})
+                if kind in accumulators[key]:
+                    accumulators[key][kind].merge(acc)
+                else:
+                    accumulators[key][kind] = acc
+
+    _save_accumulators(accumulators, output_folder)
+
+
+def _read_pair_signatures(file_in: str) -> dict:
+    """Read the input file signatures of evaluated pairs stored by a previous watch, keyed by their resolved file paths."""
+    if not Path(file_in).is_file():
+        return {}
+
+    df = starfile.read(file_in)
+    return {
+        (str(row["membrane_file"]), str(row["particle_file"])): (
+            (int(row["membrane_mtime_ns"]), int(row["membrane_size"])),
+            (int(row["particle_mtime_ns"]), int(row["particle_size"])),
+        )
+        for _, row in df.iterrows()
+    }
+
+
+def _write_pair_signatures(
+    evaluated: dict, membrane_list: list, coords_list: list, file_out: str
+):
+    """Store the input file signatures of evaluated pairs with their resolved file paths, so that a later watch can detect changed inputs.
+    Paths rather than indices identify the pairs, as `korpus main` may renumber them in the conversion table.
+    """
+    rows = [
+        dict(
+            membrane_file=membrane_list[m_idx],
+            particle_file=coords_list[c_idx],
+            membrane_mtime_ns=m_sig[0],
+            membrane_size=m_sig[1],
+            particle_mtime_ns=c_sig[0],
+            particle_size=c_sig[1],
+        )
+        for (m_idx, c_idx), (m_sig, c_sig) in sorted(evaluated.items())
+    ]
+    starfile.write(pd.DataFrame(rows), file_out)
+
+
+def _outputs_are_newer(
+    membrane_file: str, coords_file: str, m_idx: int, c_idx: int, output_folder: str
+) -> bool:
+    """Check whether the outputs of a pair exist and were written after both of its input files last changed."""
+    output_file = Path(
+        f"{output_folder}/coords/{_get_file_prefix(m_idx, c_idx)}_side_0.txt"
+    )
+    if not (
+        output_file.is_file()
+        and Path(membrane_file).is_file()
+        and Path(coords_file).is_file()
+    ):
+        return False
+
+    return output_file.stat().st_mtime_ns >= max(
+        Path(membrane_file).stat().st_mtime_ns, Path(coords_file).stat().st_mtime_ns
+    )
+
+
+def _pair_known_inputs(
+    membrane_list: list,
+    coords_list: list,
+    membrane_ready: set,
+    coords_ready: set,
+    **pairing_kwargs,
+) -> list:
+    """Pair the ready membrane and coordinates files, keeping their (stable) indices in the given lists."""
+    m_active = [i for i, f in enumerate(membrane_list) if f in membrane_ready]
+    c_active = [i for i, f in enumerate(coords_list) if f in coords_ready]
+    pairs = io.pair_inputs(
+        [membrane_list[i] for i in m_active],
+        [coords_list[i] for i in c_active],
+        **pairing_kwargs,
+    )
+
+    return [(m_active[m], c_active[c]) for m, c in pairs]
+
+
+@app.command()
+def watch(
+    membrane_input: Annotated[
+        typing.Optional[str],
+        typer.Option(
+            "-m",
+            "--membranes",
+            help="Folder (or txt file listing the TIFF files) to watch for membrane segmentation maps.",
+        ),
+    ] = None,
+    coords_input: Annotated[
+        typing.Optional[str],
+        typer.Option(
+            "-c",
+            "--coords",
+            help="Folder (or txt file listing the txt files) to watch for particle coordinates.",
+        ),
+    ] = None,
+    pixel_size_nm: Annotated[
+        typing.Optional[float],
+        typer.Option(
+            "-s", "--pixel_size", help="Pixel size of tomogram(s) in nanometers."
+        ),
+    ] = None,
+    dist_range: Annotated[
+        list[float, float],
+        typer.Option(
+            "-r", "--range", help="Range of accepted particle-membrane distances."
+        ),
+    ] = [2, 10],
+    coords_order: Annotated[
+        typing.Optional[str],
+        typer.Option(
+            "-o",
+            "--order",
+            help="Order of coordinate system used in the particle coordinates. (Optional; case-insensitive)",
+        ),
+    ] = "zxy",
+    output_folder: Annotated[
+        typing.Optional[str],
+        typer.Option(
+            "-out",
+            "--output",
+            help="Path to output folder. If specified folder does not exist, Korpuskulum will create it first. Default: ./results/",
+        ),
+    ] = "./results/",
+    pairing: Annotated[
+        str,
+        typer.Option(
+            "-p",
+            "--pairing",
+            help="Pairing of membranes and particle coordinates (all, stem, manifest or regex). See `korpus main --help`. Default: all",
+        ),
+    ] = "all",
+    manifest: Annotated[
+        typing.Optional[str],
+        typer.Option(
+            "--manifest",
+            help="STAR or CSV file listing the pairs to be evaluated (--pairing manifest). Entries whose files have not arrived yet are skipped until they do.",
+        ),
+    ] = None,
+    pair_pattern: Annotated[
+        typing.Optional[str],
+        typer.Option(
+            "--pair_pattern",
+            help="Regular expression extracting the pairing key from file stems (--pairing regex).",
+        ),
+    ] = None,
+    interval: Annotated[
+        float,
+        typer.Option(
+            "-i",
+            "--interval",
+            help="Time in seconds between checks of the input folders. A file is only evaluated once it is unchanged between two checks. Default: 10",
+        ),
+    ] = 10,
+    cache_size: Annotated[
+        int,
+        typer.Option(
+            "--cache_size",
+            help="Maximum number of membrane maps (and, separately, coordinates files) kept loaded in memory between evaluations. Default: 8",
+        ),
+    ] = 8,
+    max_memory: Annotated[
+        typing.Optional[float],
+        typer.Option(
+            "--max-memory",
+            help="Memory budget of the run in gigabytes. Each of the membrane and coordinates caches is limited to a quarter of the budget, and distance computations which wouldn't fit in the remaining memory are split into tiles. (Optional)",
+        ),
+    ] = None,
+    max_polls: Annotated[
+        typing.Optional[int],
+        typer.Option(
+            "--max_polls",
+            help="Stop after the given number of checks. (Optional; default: watch until interrupted)",
+        ),
+    ] = None,
+):
+    """Watch input folders and evaluate new or changed files as they arrive. Aggregate histograms (--aggregate) are not supported; run `korpus main --aggregate` on the collected data instead."""
+
+    # Check if parameters given
+    assert (
+        membrane_input is not None
+    ), "A file/folder must be specified for the --membranes parameter."
+    assert (
+        coords_input is not None
+    ), "A file/folder must be specified for the --coords parameter."
+    assert (
+        pixel_size_nm is not None
+    ), "A value must be given to the --pixel_size parameter."
+
+    params = config.objectify_user_input(
+        pixel_size_nm=pixel_size_nm,
+        dist_range=dist_range,
+        coords_files=[],
+        membrane_files=[],
+        order=coords_order,
+    )
+    max_memory_bytes = None if max_memory is None else int(max_memory * 1024**3)
+    cache_bytes = None if max_memory_bytes is None else max_memory_bytes // 4
+    membrane_cache = io.FileCache(
+        _prepare_membrane, maxsize=cache_size, max_bytes=cache_bytes
+    )
+    coords_cache = io.FileCache(
+        lambda f: io.load_coords(f, order=params.order),
+        maxsize=cache_size,
+        max_bytes=cache_bytes,
+    )
+
+    # Resume from an existing conversion table, keeping its indices. Pairs count as evaluated if their input
+    # signatures match those stored by a previous watch, or else if their outputs are newer than their inputs
+    membrane_list = params.membrane_files
+    coords_list = params.coords_files
+    evaluated = {}
+    failed = {}
+    conversion_path = "./conversion_lookup.star"
+    signatures_path = "./conversion_lookup_signatures.star"
+    if Path(conversion_path).is_file():
+        conversion_df = starfile.read(conversion_path)
+        stored_signatures = _read_pair_signatures(signatures_path)
+        for _, row in conversion_df.iterrows():
+            m_idx, c_idx = int(row["membrane_index"]), int(row["particle_species"])
+            m = str(Path(row["membrane_file"]).resolve())
+            c = str(Path(row["particle_file"]).resolve())
+            for file_list, idx, f in [
+                (membrane_list, m_idx, m),
+                (coords_list, c_idx, c),
+            ]:
+                file_list.extend([None] * (idx + 1 - len(file_list)))
+                file_list[idx] = f
+
+            if (m, c) in stored_signatures:
+                evaluated[(m_idx, c_idx)] = stored_signatures[(m, c)]
+            elif _outputs_are_newer(m, c, m_idx, c_idx, output_folder):
+                evaluated[(m_idx, c_idx)] = (
+                    io.get_file_signature(m),
+                    io.get_file_signature(c),
+                )
+    else:
+        conversion_df = io.export_conversion_table([], [], pairs=[])
+
+    previous_signatures = {}
+    n_polls = 0
+    try:
+        while max_polls is None or n_polls < max_polls:
+            if n_polls > 0:
+                time.sleep(interval)
+            n_polls += 1
+
+            # Only consider files which haven't changed since the last check
+            membrane_files = [
+                str(Path(f).resolve()) for f in io.parse_membrane_input(membrane_input)
+            ]
+            coords_files = [
+                str(Path(f).resolve()) for f in io.parse_coords_input(coords_input)
+            ]
+            signatures = {}
+            for f in membrane_files + coords_files:
+                try:
+                    signatures[f] = io.get_file_signature(f)
+                except FileNotFoundError:
+                    continue
+            ready = {
+                f for f, sig in signatures.items() if previous_signatures.get(f) == sig
+            }
+            previous_signatures = signatures
+
+            # New files get the next free index
+            for file_list, files in [
+                (membrane_list, membrane_files),
+                (coords_list, coords_files),
+            ]:
+                file_list.extend(
+                    [f for f in files if f in ready and f not in file_list]
+                )
+
+            pairs = _pair_known_inputs(
+                membrane_list,
+                coords_list,
+                ready,
+                ready,
+                mode=pairing,
+                manifest=manifest,
+                pattern=pair_pattern,
+                ignore_missing=True,
+            )
+            # Pairs which failed are only retried once one of their files changes
+            pending = []
+            for m_idx, c_idx in pairs:
+                pair_signature = (
+                    signatures[membrane_list[m_idx]],
+                    signatures[coords_list[c_idx]],
+                )
+                if pair_signature not in [
+                    evaluated.get((m_idx, c_idx)),
+                    failed.get((m_idx, c_idx)),
+                ]:
+                    pending.append(((m_idx, c_idx), pair_signature))
+            if len(pending) == 0:
+                continue
+
+            # Evaluate new or changed pairs, reusing cached inputs
+            succeeded = []
+            for (m_idx, c_idx), pair_signature in sorted(pending):
+                try:
+                    if max_memory_bytes is not None:
+                        _get_distance_budget(
+                            max_memory_bytes,
+                            io.get_membrane_nbytes(membrane_list[m_idx]),
+                        )
+                    seg_map, seg_nonempty = membrane_cache.get(membrane_list[m_idx])
+                    coords, restoration_order = coords_cache.get(coords_list[c_idx])
+                    distance_budget = _get_distance_budget(
+                        max_memory_bytes, membrane_cache.nbytes + coords_cache.nbytes
+                    )
+                    _evaluate_pair(
+                        seg_map,
+                        seg_nonempty,
+                        coords,
+                        restoration_order,
+                        m_idx,
+                        c_idx,
+                        params,
+                        output_folder,
+                        max_memory_bytes=distance_budget,
+                    )
+                except Exception as e:
+                    failed[(m_idx, c_idx)] = pair_signature
+                    typer.echo(
+                        f"[{dt.now():%H:%M:%S}] Failed to evaluate {coords_list[c_idx]} against {membrane_list[m_idx]}: {e}"
+                    )
+                else:
+                    evaluated[(m_idx, c_idx)] = pair_signature
+                    failed.pop((m_idx, c_idx), None)
+                    succeeded.append((m_idx, c_idx))
+                    typer.echo(
+                        f"[{dt.now():%H:%M:%S}] Evaluated {coords_list[c_idx]} against {membrane_list[m_idx]} ({_get_file_prefix(m_idx, c_idx)})"
+                    )
+            if len(succeeded) == 0:
+                continue
+            _write_pair_signatures(
+                evaluated, membrane_list, coords_list, signatures_path
+            )
+
+            # Append newly evaluated pairs to the conversion table
+            listed = set(
+                zip(conversion_df["membrane_index"], conversion_df["particle_species"])
+            )
+            new_pairs = [pair for pair in succeeded if pair not in listed]
+            if len(new_pairs) > 0:
+                conversion_df = pd.concat(
+                    [
+                        conversion_df,
+                        io.export_conversion_table(
+                            membrane_list, coords_list, pairs=new_pairs
+                        ),
+                    ],
+                    ignore_index=True,
+                )
+                starfile.write(conversion_df, conversion_path)
+    except KeyboardInterrupt:
+        typer.echo("Stopped watching.")
@@ -12,6 +12,7 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
+from dataclasses import dataclass, field
 from typing import Optional
 
 import numpy as np
@@ -76,6 +77,29 @@ def plot_polar_hist(
     hist, _, _ = np.histogram2d(
         angle_array[criteria], dist_array[criteria], bins=(abins, rbins)
     )
+    _draw_polar_hist(hist, abins, rbins, colormap=colormap, savefig=savefig)
+
+
+def _draw_polar_hist(
+    hist: npt.NDArray[any],
+    abins: npt.NDArray[any],
+    rbins: npt.NDArray[any],
+    *,
+    colormap: str = "gist_heat_r",
+    savefig: Optional[str] = None,
+):
+    """Draw a precomputed angle x distance histogram on polar axes.
+
+    Args:
+    hist (ndarray)           : 2D histogram counts with shape (len(abins)-1, len(rbins)-1)
+    abins (ndarray)          : Angular bin edges in radians
+    rbins (ndarray)          : Radial bin edges
+    colormap (optional, str) : Matplotlib colormap for histogram display. Default = gist_heat_r
+    savefig (optional, str)  : Path to polar histogram figure being saved if value provided. Default = None
+
+    Returns:
+    None
+    """
     A, R = np.meshgrid(abins, rbins)
 
     fig, ax = plt.subplots(figsize=(8, 6), subplot_kw=dict(projection="polar"))
@@ -136,3 +160,200 @@ def plot_min_dist_hist(
     if savefig is not None:
         fig.savefig(savefig)
         plt.close()
+
+
+@dataclass()
+class PolarHistAccumulator:
+    """Fixed-bin angle x distance histogram which can be updated pair by pair and merged across runs.
+
+    Only particles with 0.1 < distance <= dist_cutoff are counted, matching plot_polar_hist.
+    """
+
+    dist_cutoff: float
+    n_angle_bins: int = 36
+    n_dist_bins: int = 20
+    counts: npt.NDArray[any] = field(default=None, repr=False)
+
+    def __post_init__(self):
+        if self.counts is None:
+            self.counts = np.zeros(
+                (self.n_angle_bins, self.n_dist_bins), dtype=np.int64
+            )
+        assert self.counts.shape == (
+            self.n_angle_bins,
+            self.n_dist_bins,
+        ), "Error in plotting.PolarHistAccumulator: Counts shape doesn't match number of bins."
+
+    @property
+    def abins(self) -> npt.NDArray[any]:
+        return np.linspace(-np.pi, np.pi, self.n_angle_bins + 1)
+
+    @property
+    def rbins(self) -> npt.NDArray[any]:
+        return np.linspace(0, self.dist_cutoff, self.n_dist_bins + 1)
+
+    def update(self, dist_array: npt.NDArray[any], angle_array: npt.NDArray[any]):
+        """Add particle-membrane distances and angles of one evaluated pair to the histogram.
+
+        Args:
+        dist_array (ndarray)  : Array containing particle-membrane minimum distances
+        angle_array (ndarray) : Array containing particle-membrane angles
+        """
+        criteria = np.logical_and(0.1 < dist_array, dist_array <= self.dist_cutoff)
+        hist, _, _ = np.histogram2d(
+            angle_array[criteria],
+            dist_array[criteria],
+            bins=(self.abins, self.rbins),
+        )
+        self.counts += hist.astype(np.int64)
+
+    def merge(self, other: "PolarHistAccumulator"):
+        """Add the counts of another accumulator with identical binning to this one."""
+        assert (
+            self.dist_cutoff == other.dist_cutoff
+            and self.counts.shape == other.counts.shape
+        ), "Error in plotting.PolarHistAccumulator.merge: Accumulators have different binning."
+        self.counts += other.counts
+
+    def save(self, file_out: str):
+        np.savez(
+            file_out,
+            kind="polar",
+            dist_cutoff=self.dist_cutoff,
+            counts=self.counts,
+        )
+
+    @classmethod
+    def load(cls, file_in: str) -> "PolarHistAccumulator":
+        with np.load(file_in) as data:
+            counts = data["counts"]
+            return cls(
+                dist_cutoff=float(data["dist_cutoff"]),
+                n_angle_bins=counts.shape[0],
+                n_dist_bins=counts.shape[1],
+                counts=counts,
+            )
+
+    def plot(self, *, colormap: str = "gist_heat_r", savefig: Optional[str] = None):
+        _draw_polar_hist(
+            self.counts, self.abins, self.rbins, colormap=colormap, savefig=savefig
+        )
+
+
+@dataclass()
+class MinDistHistAccumulator:
+    """Fixed-bin minimum distance histogram, split by membrane side, which can be updated pair by pair and merged across runs.
+
+    Row 0 of counts holds side O (orientation != 1), row 1 holds side I (orientation == 1).
+    """
+
+    dist_low: float = 2
+    dist_high: float = 10
+    n_bins: int = 20
+    counts: npt.NDArray[any] = field(default=None, repr=False)
+
+    def __post_init__(self):
+        if self.counts is None:
+            self.counts = np.zeros((2, self.n_bins), dtype=np.int64)
+        assert self.counts.shape == (
+            2,
+            self.n_bins,
+        ), "Error in plotting.MinDistHistAccumulator: Counts shape doesn't match number of bins."
+
+    @property
+    def bins(self) -> npt.NDArray[any]:
+        return np.linspace(self.dist_low, self.dist_high, self.n_bins + 1)
+
+    def update(self, dist_array: npt.NDArray[any], orientations: npt.NDArray[any]):
+        """Add particle-membrane distances of one evaluated pair to the histogram.
+
+        Args:
+        dist_array (ndarray)   : Array containing particle-membrane minimum distances
+        orientations (ndarray) : Array containing side tags of particles
+        """
+        crit_1 = orientations == 1
+        crit_2 = np.logical_and(
+            self.dist_low <= dist_array,
+            dist_array <= self.dist_high,
+        )
+        self.counts[0] += np.histogram(dist_array[(~crit_1 & crit_2)], self.bins)[0]
+        self.counts[1] += np.histogram(dist_array[(crit_1 & crit_2)], self.bins)[0]
+
+    def merge(self, other: "MinDistHistAccumulator"):
+        """Add the counts of another accumulator with identical binning to this one."""
+        assert (
+            self.dist_low == other.dist_low
+            and self.dist_high == other.dist_high
+            and self.counts.shape == other.counts.shape
+        ), "Error in plotting.MinDistHistAccumulator.merge: Accumulators have different binning."
+        self.counts += other.counts
+
+    def save(self, file_out: str):
+        np.savez(
+            file_out,
+            kind="mindist",
+            dist_low=self.dist_low,
+            dist_high=self.dist_high,
+            counts=self.counts,
+        )
+
+    @classmethod
+    def load(cls, file_in: str) -> "MinDistHistAccumulator":
+        with np.load(file_in) as data:
+            counts = data["counts"]
+            return cls(
+                dist_low=float(data["dist_low"]),
+                dist_high=float(data["dist_high"]),
+                n_bins=counts.shape[1],
+                counts=counts,
+            )
+
+    def plot(
+        self,
+        protein_name: str,
+        membrane_name: str,
+        *,
+        savefig: Optional[str] = None,
+    ):
+        fig, ax = plt.subplots()
+        ax.stairs(
+            self.counts[1],
+            self.bins,
+            fill=True,
+            alpha=0.75,
+            label=f"{protein_name}, Membrane {membrane_name}, Side I",
+        )
+        ax.stairs(
+            self.counts[0],
+            self.bins,
+            fill=True,
+            alpha=0.75,
+            label=f"{protein_name}, Membrane {membrane_name}, Side O",
+        )
+        ax.legend()
+
+        if savefig is not None:
+            fig.savefig(savefig)
+            plt.close()
+
+
+def load_accumulator(file_in: str):
+    """Load a histogram accumulator saved with PolarHistAccumulator.save or MinDistHistAccumulator.save.
+
+    Args:
+    file_in (str) : Path to npz file containing the accumulator
+
+    Returns:
+    PolarHistAccumulator or MinDistHistAccumulator
+    """
+    with np.load(file_in) as data:
+        kind = str(data["kind"])
+
+    if kind == "polar":
+        return PolarHistAccumulator.load(file_in)
+    elif kind == "mindist":
+        return MinDistHistAccumulator.load(file_in)
+    else:
+        raise ValueError(
+            f"Error in plotting.load_accumulator: Unknown accumulator type {kind}."
+        )
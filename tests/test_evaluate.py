@@ -0,0 +1,58 @@
+import unittest
+
+import numpy as np
+
+from korpuskulum import evaluate
+
+
+class EvaluateTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        rng = np.random.default_rng(0)
+
+        # Create a slanted membrane with randomly placed particles around it
+        self.seg_map = np.zeros(shape=(5, 64, 64), dtype=int)
+        for x in range(64):
+            self.seg_map[:, 10 + x // 2, x] = 1
+        self.coords = np.column_stack(
+            [rng.integers(5, size=100), rng.integers(64, size=(100, 2))]
+        )
+
+    def test_tiled_distribution(self):
+        """
+        Test that get_distribution gives identical results with and without a memory budget
+        """
+        slice_idx = np.unique(self.coords.T[0])
+        full = evaluate.get_distribution(
+            self.seg_map, self.coords, 1.0, slice_idx=slice_idx
+        )
+        tiled = evaluate.get_distribution(
+            self.seg_map,
+            self.coords,
+            1.0,
+            slice_idx=slice_idx,
+            max_memory_bytes=evaluate.estimate_slice_bytes(7, 20),
+        )
+
+        assert len(full) == len(
+            tiled
+        ), "Error in evaluate.get_distribution: Number of evaluated slices differs with tiling."
+        for full_slice, tiled_slice in zip(full, tiled):
+            for full_item, tiled_item in zip(full_slice, tiled_slice):
+                assert np.array_equal(
+                    full_item, tiled_item
+                ), "Error in evaluate.get_distribution: Tiled results differ from untiled results."
+
+    def test_get_tile_rows(self):
+        """
+        Test that tiles fit in the given memory
+        """
+        tile_rows = evaluate.get_tile_rows(50, 10**6)
+
+        assert (
+            evaluate.estimate_slice_bytes(tile_rows, 50) <= 10**6
+        ), "Error in evaluate.get_tile_rows: Tile exceeds memory budget."
+        assert (
+            evaluate.get_tile_rows(50, 1) == 1
+        ), "Error in evaluate.get_tile_rows: Tiles must contain at least one membrane pixel."
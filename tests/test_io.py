@@ -65,6 +65,103 @@ class IOSmokeTest(unittest.TestCase):
             1,
         ], "Error in io.load_coords: Output numerical order wrong (should be [0,2,1])."
 
+    def test_pair_inputs(self):
+        """
+        Test the pair_inputs function
+        """
+        membrane_list = ["segm/TS_01.tif", "segm/TS_02.tif", "segm/TS_03.tif"]
+        coords_list = ["picks/TS_02.txt", "picks/TS_01.txt", "picks/TS_03_ribo.txt"]
+
+        manifest_path = f"{self.tmpdir.name}/manifest.csv"
+        with open(manifest_path, "w") as f:
+            f.write("membrane_file,particle_file\n")
+            f.write("TS_03.tif,TS_03_ribo.txt\n")
+
+        all_pairs = io.pair_inputs(membrane_list, coords_list, mode="all")
+        stem_pairs = io.pair_inputs(membrane_list, coords_list, mode="stem")
+        regex_pairs = io.pair_inputs(
+            membrane_list, coords_list, mode="regex", pattern=r"TS_\d+"
+        )
+        manifest_pairs = io.pair_inputs(
+            membrane_list, coords_list, mode="manifest", manifest=manifest_path
+        )
+
+        assert (
+            len(all_pairs) == 9
+        ), "Error in io.pair_inputs: Full pairing should give every combination."
+        assert stem_pairs == [
+            (0, 1),
+            (1, 0),
+        ], "Error in io.pair_inputs: Stem pairing wrong."
+        assert regex_pairs == [
+            (0, 1),
+            (1, 0),
+            (2, 2),
+        ], "Error in io.pair_inputs: Regex pairing wrong."
+        assert manifest_pairs == [
+            (2, 2)
+        ], "Error in io.pair_inputs: Manifest pairing wrong."
+
+        # Relative manifest entries are taken from the manifest folder, and name matches must be unique
+        nested_list = [
+            f"{self.tmpdir.name}/TS_01/membrane.tif",
+            f"{self.tmpdir.name}/TS_02/membrane.tif",
+        ]
+        nested_manifest_path = f"{self.tmpdir.name}/nested_manifest.csv"
+        with open(nested_manifest_path, "w") as f:
+            f.write("membrane_file,particle_file\n")
+            f.write("TS_02/membrane.tif,TS_01.txt\n")
+        nested_pairs = io.pair_inputs(
+            nested_list, coords_list, mode="manifest", manifest=nested_manifest_path
+        )
+        assert nested_pairs == [
+            (1, 1)
+        ], "Error in io.pair_inputs: Relative manifest entries not resolved against manifest folder."
+
+        with open(nested_manifest_path, "w") as f:
+            f.write("membrane_file,particle_file\n")
+            f.write("elsewhere/membrane.tif,TS_01.txt\n")
+        with self.assertRaises(AssertionError):
+            io.pair_inputs(
+                nested_list, coords_list, mode="manifest", manifest=nested_manifest_path
+            )
+
+        conversion_df = io.export_conversion_table(
+            membrane_list, coords_list, pairs=regex_pairs
+        )
+        assert list(conversion_df["particle_file"]) == [
+            "picks/TS_01.txt",
+            "picks/TS_02.txt",
+            "picks/TS_03_ribo.txt",
+        ], "Error in io.export_conversion_table: Conversion table doesn't follow given pairs."
+
+    def test_file_cache(self):
+        """
+        Test the FileCache class
+        """
+        calls = []
+
+        def loader(file_in):
+            calls.append(file_in)
+            return np.loadtxt(file_in)
+
+        cache_path = f"{self.tmpdir.name}/cache_coords.txt"
+        np.savetxt(cache_path, self.coords, fmt="%4d")
+        cache = io.FileCache(loader, maxsize=1)
+
+        cache.get(cache_path)
+        cache.get(cache_path)
+        assert len(calls) == 1, "Error in io.FileCache: Unchanged file reloaded."
+
+        np.savetxt(cache_path, self.coords[:5], fmt="%4d")
+        os.utime(cache_path, ns=(0, 0))
+        assert (
+            len(cache.get(cache_path)) == 5 and len(calls) == 2
+        ), "Error in io.FileCache: Changed file not reloaded."
+
+        cache.get(self.coords_path)
+        assert len(cache) == 1, "Error in io.FileCache: Cache size not bounded."
+
     @classmethod
     def tearDownClass(self):
         pass
@@ -0,0 +1,201 @@
+import os
+import tempfile
+import unittest
+import warnings
+
+import tifffile
+import numpy as np
+import starfile
+from typer.testing import CliRunner
+
+from korpuskulum import main, plotting
+
+
+class CommandTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmpdir.name)
+        os.mkdir("segm")
+        os.mkdir("picks")
+        self.rng = np.random.default_rng(0)
+
+        # Create slanted membrane segmentation map
+        self.membrane = np.zeros(shape=(5, 64, 64), dtype=np.uint8)
+        for x in range(64):
+            self.membrane[:, 10 + x // 2, x] = 1
+
+    def write_tomogram(self, name, n_particles=30):
+        tifffile.imwrite(f"segm/{name}.tif", self.membrane, photometric="minisblack")
+        self.write_coords(name, n_particles)
+
+    def write_coords(self, name, n_particles):
+        coords = np.column_stack(
+            [
+                self.rng.integers(5, size=n_particles),
+                self.rng.integers(64, size=(n_particles, 2)),
+            ]
+        )
+        np.savetxt(f"picks/{name}.txt", coords, fmt="%4d")
+
+    def run_watch(self, membrane_input="segm", max_polls=2):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            result = CliRunner().invoke(
+                main.app,
+                [
+                    "watch",
+                    "-m",
+                    membrane_input,
+                    "-c",
+                    "picks",
+                    "-s",
+                    "1",
+                    "-p",
+                    "stem",
+                    "-i",
+                    "0",
+                    "--max_polls",
+                    str(max_polls),
+                ],
+            )
+        assert result.exception is None, result.output
+
+        return result.output.splitlines()
+
+    def test_aggregate(self):
+        """
+        Test that main --aggregate saves dataset-wide histograms and that they merge across runs
+        """
+        for name in ["TS_01", "TS_02", "TS_03"]:
+            self.write_tomogram(name)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            result = CliRunner().invoke(
+                main.app,
+                [
+                    "main",
+                    "-m",
+                    "segm",
+                    "-c",
+                    "picks",
+                    "-s",
+                    "1",
+                    "-p",
+                    "stem",
+                    "--aggregate",
+                ],
+            )
+            assert result.exception is None, result.output
+            result = CliRunner().invoke(
+                main.app,
+                [
+                    "aggregate",
+                    "-i",
+                    "results/aggregate",
+                    "-i",
+                    "results/aggregate",
+                    "-out",
+                    "merged",
+                ],
+            )
+            assert result.exception is None, result.output
+
+        for kind in ["polar", "mindist"]:
+            pair_counts = sum(
+                plotting.load_accumulator(
+                    f"results/aggregate/{name}/all_{kind}.npz"
+                ).counts
+                for name in ["TS_01", "TS_02", "TS_03"]
+            )
+            dataset_counts = plotting.load_accumulator(
+                f"results/aggregate/all/all_{kind}.npz"
+            ).counts
+            merged_counts = plotting.load_accumulator(
+                f"merged/all/all_{kind}.npz"
+            ).counts
+
+            assert (
+                pair_counts.sum() > 0
+            ), "Error in main.main: Aggregate histograms are empty."
+            assert np.array_equal(
+                dataset_counts, pair_counts
+            ), "Error in main.main: Dataset-wide counts differ from the sum of per-pair counts."
+            assert np.array_equal(
+                merged_counts, 2 * pair_counts
+            ), "Error in main.aggregate: Merged counts differ from the sum of the inputs."
+
+    def test_watch(self):
+        """
+        Test that watch evaluates new and changed pairs only, and appends them to the conversion table
+        """
+        self.write_tomogram("TS_01")
+        evaluated = [l for l in self.run_watch() if "Evaluated" in l]
+        assert (
+            len(evaluated) == 1 and "TS_01" in evaluated[0]
+        ), "Error in main.watch: New pair not evaluated."
+        assert (
+            len(starfile.read("conversion_lookup.star")) == 1
+        ), "Error in main.watch: Conversion table not written."
+
+        # Change TS_01 particles and add TS_02 while the watcher is stopped
+        self.write_coords("TS_01", n_particles=40)
+        self.write_tomogram("TS_02")
+        evaluated = [l for l in self.run_watch() if "Evaluated" in l]
+        assert (
+            len(evaluated) == 2
+        ), "Error in main.watch: Changed and new pairs not both evaluated."
+        assert (
+            len(starfile.read("conversion_lookup.star")) == 2
+        ), "Error in main.watch: Conversion table should gain one row."
+
+        # Nothing has changed, even if the same folder is given differently
+        evaluated = [
+            l for l in self.run_watch(membrane_input="./segm/") if "Evaluated" in l
+        ]
+        assert len(evaluated) == 0, "Error in main.watch: Unchanged pairs evaluated."
+        assert (
+            len(starfile.read("conversion_lookup.star")) == 2
+        ), "Error in main.watch: Conversion table gained duplicate rows."
+
+    def test_watch_after_main(self):
+        """
+        Test that watch doesn't re-evaluate pairs after `korpus main` renumbered the conversion table
+        """
+        self.write_tomogram("TS_02")
+        self.run_watch()
+
+        # TS_01 sorts first, so main gives it index 0 which watch had given to TS_02
+        self.write_tomogram("TS_01")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            result = CliRunner().invoke(
+                main.app,
+                ["main", "-m", "segm", "-c", "picks", "-s", "1", "-p", "stem"],
+            )
+        assert result.exception is None, result.output
+
+        evaluated = [l for l in self.run_watch() if "Evaluated" in l]
+        assert (
+            len(evaluated) == 0
+        ), "Error in main.watch: Pairs evaluated by main were evaluated again."
+
+    def test_watch_failure(self):
+        """
+        Test that failed pairs are neither retried every poll nor added to the conversion table
+        """
+        self.write_tomogram("TS_01")
+        tifffile.imwrite("segm/TS_01.tif", np.zeros_like(self.membrane))
+        output = self.run_watch(max_polls=4)
+
+        assert (
+            len([l for l in output if "Failed" in l]) == 1
+        ), "Error in main.watch: Failed pair should be tried exactly once."
+        assert not os.path.isfile(
+            "conversion_lookup.star"
+        ), "Error in main.watch: Failed pair added to conversion table."
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmpdir.cleanup()
@@ -0,0 +1,63 @@
+import tempfile
+import unittest
+
+import numpy as np
+
+from korpuskulum import plotting
+
+
+class AccumulatorTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+        rng = np.random.default_rng(0)
+        self.dist = rng.uniform(0, 12, size=200)
+        self.angles = rng.uniform(-np.pi, np.pi, size=200)
+        self.orientations = rng.integers(2, size=200)
+
+    def test_polar_merge(self):
+        """
+        Test that merging partial polar histograms equals accumulating everything at once
+        """
+        full = plotting.PolarHistAccumulator(dist_cutoff=10)
+        full.update(self.dist, self.angles)
+
+        part_1 = plotting.PolarHistAccumulator(dist_cutoff=10)
+        part_2 = plotting.PolarHistAccumulator(dist_cutoff=10)
+        part_1.update(self.dist[:75], self.angles[:75])
+        part_2.update(self.dist[75:], self.angles[75:])
+        part_1.merge(part_2)
+
+        criteria = np.logical_and(0.1 < self.dist, self.dist <= 10)
+        assert np.array_equal(
+            full.counts, part_1.counts
+        ), "Error in plotting.PolarHistAccumulator: Merged counts differ from full counts."
+        assert (
+            full.counts.sum() == criteria.sum()
+        ), "Error in plotting.PolarHistAccumulator: Counts don't match number of particles in range."
+
+    def test_mindist_save_load(self):
+        """
+        Test that minimum distance histograms survive a save/load round trip and split sides correctly
+        """
+        acc = plotting.MinDistHistAccumulator(dist_low=2, dist_high=10, n_bins=16)
+        acc.update(self.dist, self.orientations)
+        acc.save(f"{self.tmpdir.name}/mindist.npz")
+        loaded = plotting.load_accumulator(f"{self.tmpdir.name}/mindist.npz")
+
+        in_range = np.logical_and(2 <= self.dist, self.dist <= 10)
+        assert isinstance(
+            loaded, plotting.MinDistHistAccumulator
+        ), "Error in plotting.load_accumulator: Wrong accumulator type loaded."
+        assert np.array_equal(
+            acc.counts, loaded.counts
+        ), "Error in plotting.load_accumulator: Loaded counts differ from saved counts."
+        assert (
+            loaded.counts[1].sum() == (in_range & (self.orientations == 1)).sum()
+        ), "Error in plotting.MinDistHistAccumulator: Side I counts wrong."
+
+    @classmethod
+    def tearDownClass(self):
+        self.tmpdir.cleanup()